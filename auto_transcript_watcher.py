@@ -8,17 +8,108 @@ import os
 import json
 import time
 import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
+from smart_pipeline_runner import SmartPipelineRunner
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+def _read_json(path):
+    """Read a JSON file, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(Path(path).read_bytes())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def _write_json(path, data):
+    """Write data as indented JSON, using orjson when it is installed"""
+    if orjson is not None:
+        Path(path).write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+def _dumps_compact(data):
+    """Serialize data to compact UTF-8 JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+class _SafeCharTable(dict):
+    """str.translate table that deletes characters not allowed in combined filenames
+    
+    Copy of the table in src/transcript_auto_combiner.py (src/ and the top-level scripts don't
+    import each other); keep the two in sync so both name combined files the same way.
+    """
+    
+    def __missing__(self, codepoint):
+        char = chr(codepoint)
+        value = codepoint if char.isalnum() or char in ' -_' else None
+        self[codepoint] = value
+        return value
+
+_SAFE_CHARS = _SafeCharTable()
+
+def _safe_location(location_name):
+    """Turn a location name into the form used in combined transcript filenames"""
+    return location_name.translate(_SAFE_CHARS).strip().replace(' ', '_')
+
+def _extract_segment_texts(path):
+    """Return the stripped text of every segment in a transcript file"""
+    if ijson is not None:
+        # Stream only the segment texts instead of building the whole document
+        with open(path, 'rb') as f:
+            is_list = f.read(64).lstrip()[:1] == b'['
+            f.seek(0)
+            prefix = 'item.text' if is_list else 'filtered_transcription.item.text'
+            return [text.strip() for text in ijson.items(f, prefix)]
+    
+    data = _read_json(path)
+    if isinstance(data, list):
+        segments = data
+    else:
+        segments = data.get('filtered_transcription', data)
+    
+    text_parts = []
+    if isinstance(segments, list):
+        for segment in segments:
+            if isinstance(segment, dict) and 'text' in segment:
+                text_parts.append(segment['text'].strip())
+    return text_parts
+
+def _iter_transcripts(location_dir):
+    """Yield (video_folder_name, DirEntry) for every transcript file of a location"""
+    with os.scandir(location_dir) as video_entries:
+        for video_entry in video_entries:
+            if not video_entry.is_dir():
+                continue
+            with os.scandir(video_entry.path) as file_entries:
+                for entry in file_entries:
+                    if entry.name.endswith('_transcription.json') and not entry.name.startswith('.'):
+                        yield video_entry.name, entry
 
 class TranscriptFileHandler(FileSystemEventHandler):
     """Handles file system events for transcript files"""
     
+    recent_event_ttl = 10  # seconds during which repeat events for a file are not logged again
+    max_recent_events = 4096
+    
     def __init__(self, watcher_instance):
         self.watcher = watcher_instance
-        self.processed_files = set()
+        self._recent = OrderedDict()  # src_path -> monotonic time first seen
         
     def on_created(self, event):
         """Handle file creation events"""
@@ -38,20 +129,25 @@ class TranscriptFileHandler(FileSystemEventHandler):
     
     def _handle_transcript_event(self, file_path, event_type):
         """Handle transcript file events"""
-        file_path = Path(file_path)
+        now = time.monotonic()
         
-        # Avoid processing the same file multiple times quickly
-        if file_path in self.processed_files:
-            return
-            
-        self.processed_files.add(file_path)
+        # Forget events older than the TTL so later changes are picked up again
+        while self._recent and now - next(iter(self._recent.values())) >= self.recent_event_ttl:
+            self._recent.popitem(last=False)
         
-        print(f"📄 {event_type.title()} transcript file: {file_path.name}")
+        # Only log a file once per TTL; every event still reschedules its location
+        # so a rewrite after the first combine is picked up
+        is_repeat = file_path in self._recent
+        if not is_repeat:
+            self._recent[file_path] = now
+            if len(self._recent) > self.max_recent_events:
+                self._recent.popitem(last=False)
         
-        # Add a small delay to ensure file is fully written
-        time.sleep(2)
+        file_path = Path(file_path)
+        if not is_repeat:
+            print(f"📄 {event_type.title()} transcript file: {file_path.name}")
         
-        # Schedule combination check
+        # Schedule combination check (file stability is verified before combining)
         self.watcher.schedule_location_check(file_path)
 
 class AutoTranscriptWatcher:
@@ -60,13 +156,35 @@ class AutoTranscriptWatcher:
     def __init__(self, video_processor_path="../../video-processor", ai_pipeline_path="."):
         self.video_processor_path = Path(video_processor_path)
         self.ai_pipeline_path = Path(ai_pipeline_path)
-        self.analysis_dir = self.video_processor_path / "analysis"
+        # Resolved once so event paths can be matched with a plain prefix check
+        self.analysis_dir = (self.video_processor_path / "analysis").resolve()
         self.input_transcripts_dir = self.ai_pipeline_path / "Input" / "transcripts"
         
         # State tracking
         self.location_state_file = self.ai_pipeline_path / ".location_states.json"
-        self.combination_delay = 30  # seconds to wait before combining
-        self.pending_combinations = {}
+        self.pipeline_history_file = self.ai_pipeline_path / ".pipeline_processed.json"
+        self._states_cache = None
+        self._history_cache = None
+        self._history_mtime = None
+        self._state_lock = threading.Lock()  # guards location states and the text cache
+        self._text_cache_file = self.ai_pipeline_path / ".transcript_text_cache.json"
+        self._text_cache = self.load_text_cache()
+        self._text_cache_dirty = False  # set by combines; the cache is saved once per scan/batch
+        self.combination_delay = 30  # max seconds a location waits while files keep arriving
+        self.quiet_period = 2  # seconds without new events before combining
+        self.settle_interval = 0.1  # seconds between size checks for files still being written
+        self.max_combine_workers = min(8, os.cpu_count() or 4)
+        self.pending_combinations = {}  # location -> {'first_ts': float, 'last_ts': float}
+        self._pending_lock = threading.Lock()
+        self._pending_event = threading.Event()
+        self._scheduler_thread = None
+        
+        # Smart pipeline runs in-process on a worker thread
+        self._runner = SmartPipelineRunner(base_path=self.ai_pipeline_path)
+        self._pipeline_lock = threading.Lock()
+        self._pipeline_requested = False
+        self._pipeline_running = False
+        self._pipeline_thread = None
         
         # Ensure directories exist
         self.input_transcripts_dir.mkdir(parents=True, exist_ok=True)
@@ -78,9 +196,8 @@ class AutoTranscriptWatcher:
         """Load the current state of each location"""
         if self.location_state_file.exists():
             try:
-                with open(self.location_state_file, 'r') as f:
-                    return json.load(f)
-            except:
+                return _read_json(self.location_state_file)
+            except (OSError, ValueError):
                 pass
         return {}
     
@@ -88,26 +205,108 @@ class AutoTranscriptWatcher:
         """Save the current state of each location"""
         states['last_updated'] = datetime.now().isoformat()
         try:
-            with open(self.location_state_file, 'w') as f:
-                json.dump(states, f, indent=2)
+            _write_json(self.location_state_file, states)
         except Exception as e:
             print(f"Warning: Could not save location states: {e}")
     
+    def load_pipeline_history(self):
+        """Load the smart pipeline's processing history"""
+        if self.pipeline_history_file.exists():
+            try:
+                return _read_json(self.pipeline_history_file)
+            except Exception as e:
+                print(f"Warning: Could not check smart pipeline history: {e}")
+        return {}
+    
+    def _load_once(self):
+        """Return (location states, pipeline history), reading each file only when needed
+        
+        Location states are only written by the watcher, so they stay cached. The
+        pipeline history is written by the smart pipeline and is re-read when its
+        mtime changes.
+        """
+        if self._states_cache is None:
+            self._states_cache = self.load_location_states()
+        
+        try:
+            history_mtime = self.pipeline_history_file.stat().st_mtime_ns
+        except OSError:
+            history_mtime = None
+        if self._history_cache is None or history_mtime != self._history_mtime:
+            self._history_cache = self.load_pipeline_history()
+            self._history_mtime = history_mtime
+        
+        return self._states_cache, self._history_cache
+    
+    def _flush(self):
+        """Write the cached location states back to disk"""
+        if self._states_cache is not None:
+            self.save_location_states(self._states_cache)
+    
+    def load_text_cache(self):
+        """Load extracted transcript text keyed by transcript path"""
+        if self._text_cache_file.exists():
+            try:
+                return _read_json(self._text_cache_file)
+            except (OSError, ValueError):
+                pass
+        return {}
+    
+    def save_text_cache(self):
+        """Save extracted transcript text for reuse across combinations
+        
+        Entries for transcripts that no longer exist are dropped first. The file is
+        written compact and outside the state lock so running combines aren't blocked.
+        """
+        with self._state_lock:
+            if not self._text_cache_dirty:
+                return
+            self._text_cache_dirty = False
+            cached_paths = list(self._text_cache)
+        
+        analysis_prefix = os.path.join(self.analysis_dir, '')
+        stale_paths = [path for path in cached_paths
+                       if not path.startswith(analysis_prefix) or not os.path.exists(path)]
+        
+        with self._state_lock:
+            for path in stale_paths:
+                self._text_cache.pop(path, None)
+            snapshot = dict(self._text_cache)
+        
+        try:
+            self._text_cache_file.write_bytes(_dumps_compact(snapshot))
+        except Exception as e:
+            print(f"Warning: Could not save transcript text cache: {e}")
+            with self._state_lock:
+                self._text_cache_dirty = True
+    
+    def _get_transcript_text(self, transcript_file):
+        """Return (text, segment_count) for a transcript, reusing cached text when unchanged"""
+        stat = transcript_file.stat()
+        cached = self._text_cache.get(transcript_file.path)
+        if cached and cached['mtime'] == stat.st_mtime_ns and cached['size'] == stat.st_size:
+            return cached['text'], cached['segment_count']
+        
+        text_parts = _extract_segment_texts(transcript_file.path)
+        video_text = ' '.join(text_parts)
+        with self._state_lock:
+            self._text_cache[transcript_file.path] = {
+                'mtime': stat.st_mtime_ns,
+                'size': stat.st_size,
+                'text': video_text,
+                'segment_count': len(text_parts)
+            }
+        return video_text, len(text_parts)
+    
     def get_location_from_path(self, file_path):
         """Extract location name from file path"""
         # file_path should be like: .../analysis/Discovery Park July 9/Discovery Park July 9_1/...
-        parts = file_path.parts
-        analysis_idx = -1
-        
-        for i, part in enumerate(parts):
-            if part == "analysis":
-                analysis_idx = i
-                break
-        
-        if analysis_idx >= 0 and len(parts) > analysis_idx + 1:
-            return parts[analysis_idx + 1]
+        try:
+            relative_parts = Path(file_path).relative_to(self.analysis_dir).parts
+        except ValueError:
+            return None
         
-        return None
+        return relative_parts[0] if relative_parts else None
     
     def get_location_file_hash(self, location_name):
         """Get hash of all transcript files for a location"""
@@ -115,11 +314,7 @@ class AutoTranscriptWatcher:
         if not location_dir.exists():
             return None
         
-        all_transcript_files = []
-        for video_dir in location_dir.iterdir():
-            if video_dir.is_dir():
-                transcript_files = list(video_dir.glob("*_transcription.json"))
-                all_transcript_files.extend(transcript_files)
+        all_transcript_files = [entry for _, entry in _iter_transcripts(location_dir)]
         
         if not all_transcript_files:
             return None
@@ -128,49 +323,63 @@ class AutoTranscriptWatcher:
         all_transcript_files.sort(key=lambda x: x.name)
         
         # Create hash based on filenames and modification times
-        hash_content = ""
-        for file in all_transcript_files:
+        hasher = hashlib.blake2b(digest_size=16)
+        for entry in all_transcript_files:
             try:
-                stat = file.stat()
-                hash_content += f"{file.name}:{stat.st_mtime}:{stat.st_size};"
-            except:
+                stat = entry.stat(follow_symlinks=False)
+                hasher.update(f"{entry.name}:{stat.st_mtime_ns}:{stat.st_size};".encode())
+            except OSError:
                 continue
         
-        return hashlib.md5(hash_content.encode()).hexdigest()
+        return hasher.hexdigest()
     
-    def check_location_needs_combination(self, location_name):
-        """Check if a location needs to be combined/recombined"""
+    def _index_combined_files(self):
+        """Group existing combined transcript filenames by safe location name"""
+        existing = {}
+        with os.scandir(self.input_transcripts_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if not (name.startswith('combined_') and name.endswith('.json')):
+                    continue
+                # combined_<safe_location>_<YYYYmmdd>_<HHMMSS>.json
+                parts = name[len('combined_'):-len('.json')].rsplit('_', 2)
+                if len(parts) == 3:
+                    existing.setdefault(parts[0], []).append(name)
+        return existing
+    
+    def check_location_needs_combination(self, location_name, states=None, history=None, existing=None):
+        """Check if a location needs to be combined/recombined
+        
+        states, history and existing (from _index_combined_files) may be passed
+        in when checking many locations at once.
+        """
         current_hash = self.get_location_file_hash(location_name)
         if not current_hash:
             return False
         
+        if states is None or history is None:
+            states, history = self._load_once()
+        
         # Check smart pipeline history first
-        smart_pipeline_log = self.ai_pipeline_path / ".pipeline_processed.json"
-        if smart_pipeline_log.exists():
-            try:
-                with open(smart_pipeline_log, 'r') as f:
-                    pipeline_history = json.load(f)
-                
-                # Check if any combined file for this location was already processed
-                processed_files = pipeline_history.get('processed_files', {})
-                for filename, file_info in processed_files.items():
-                    if location_name.replace(' ', '_') in filename and 'combined_' in filename:
-                        print(f"✓ {location_name}: Already processed by smart pipeline")
-                        # Update our state to match
-                        states = self.load_location_states()
-                        states[location_name] = {
-                            'file_hash': current_hash,
-                            'last_combined': file_info.get('processed_at', datetime.now().isoformat()),
-                            'combined_file': 'processed_by_smart_pipeline',
-                            'transcript_count': 'unknown'
-                        }
-                        self.save_location_states(states)
-                        return False
-            except Exception as e:
-                print(f"Warning: Could not check smart pipeline history: {e}")
+        try:
+            # Check if any combined file for this location was already processed
+            processed_files = history.get('processed_files', {})
+            for filename, file_info in processed_files.items():
+                if location_name.replace(' ', '_') in filename and 'combined_' in filename:
+                    print(f"✓ {location_name}: Already processed by smart pipeline")
+                    # Update our state to match
+                    states[location_name] = {
+                        'file_hash': current_hash,
+                        'last_combined': file_info.get('processed_at', datetime.now().isoformat()),
+                        'combined_file': 'processed_by_smart_pipeline',
+                        'transcript_count': 'unknown'
+                    }
+                    self._flush()
+                    return False
+        except Exception as e:
+            print(f"Warning: Could not check smart pipeline history: {e}")
         
-        # Load saved states
-        states = self.load_location_states()
+        # Check saved state
         location_state = states.get(location_name, {})
         
         saved_hash = location_state.get('file_hash')
@@ -182,10 +391,12 @@ class AutoTranscriptWatcher:
             return True
         
         # Check if combined file exists in output directory
-        safe_location = "".join(c for c in location_name if c.isalnum() or c in (' ', '-', '_')).strip()
-        safe_location = safe_location.replace(' ', '_')
+        safe_location = _safe_location(location_name)
         
-        combined_files = list(self.input_transcripts_dir.glob(f"combined_{safe_location}_*.json"))
+        if existing is not None:
+            combined_files = existing.get(safe_location)
+        else:
+            combined_files = list(self.input_transcripts_dir.glob(f"combined_{safe_location}_*.json"))
         if not combined_files:
             print(f"🆕 {location_name}: No combined file exists, needs combination")
             return True
@@ -193,6 +404,56 @@ class AutoTranscriptWatcher:
         print(f"✓ {location_name}: Up to date")
         return False
     
+    def _write_combined_file(self, output_path, location_name, transcript_files):
+        """Stream a combined transcript file to disk one transcript at a time"""
+        # Content is written before metadata so each transcript can go straight to disk;
+        # the file is renamed into place once complete so the pipeline never sees a partial file
+        tmp_path = output_path.with_name(f".{output_path.name}.tmp")
+        source_files = []
+        
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(b'{"combined_transcript":{"content":{"individual_transcripts":[')
+                
+                for video_name, transcript_file in transcript_files:
+                    try:
+                        # Extract text content
+                        video_text, segment_count = self._get_transcript_text(transcript_file)
+                    except Exception as e:
+                        print(f"⚠️  Error processing {transcript_file.path}: {e}")
+                        continue
+                    
+                    if source_files:
+                        f.write(b',')
+                    f.write(_dumps_compact({
+                        'source_file': transcript_file.name,
+                        'video_folder': video_name,
+                        'text_content': video_text,
+                        'segment_count': segment_count
+                    }))
+                    
+                    source_files.append({
+                        'file': transcript_file.name,
+                        'video_folder': video_name
+                    })
+                
+                f.write(b']},"metadata":')
+                f.write(_dumps_compact({
+                    'location': location_name,
+                    'created_at': datetime.now().isoformat(),
+                    'total_source_files': len(transcript_files),
+                    'source_files': source_files
+                }))
+                f.write(b'}}')
+            
+            os.replace(tmp_path, output_path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+    
     def combine_location_transcripts(self, location_name):
         """Combine transcript files for a specific location"""
         location_dir = self.analysis_dir / location_name
@@ -201,110 +462,43 @@ class AutoTranscriptWatcher:
             return False
         
         # Find all transcript files
-        transcript_files = []
-        for video_dir in location_dir.iterdir():
-            if video_dir.is_dir():
-                video_transcripts = list(video_dir.glob("*_transcription.json"))
-                transcript_files.extend(video_transcripts)
+        transcript_files = list(_iter_transcripts(location_dir))
         
         if not transcript_files:
             print(f"❌ No transcript files found for {location_name}")
             return False
         
         # Sort files for consistent ordering
-        transcript_files.sort(key=lambda x: x.name)
+        transcript_files.sort(key=lambda x: x[1].name)
         
         print(f"🔄 Combining {len(transcript_files)} files for {location_name}")
         
-        # Combine transcripts
-        combined_data = {
-            'combined_transcript': {
-                'metadata': {
-                    'location': location_name,
-                    'created_at': datetime.now().isoformat(),
-                    'total_source_files': len(transcript_files),
-                    'source_files': []
-                },
-                'content': {
-                    'full_text': '',
-                    'individual_transcripts': []
-                }
-            }
-        }
-        
-        all_text_parts = []
-        
-        for transcript_file in transcript_files:
-            try:
-                with open(transcript_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                
-                # Extract text content
-                text_parts = []
-                if isinstance(data, list):
-                    segments = data
-                else:
-                    segments = data.get('filtered_transcription', data)
-                
-                if isinstance(segments, list):
-                    for segment in segments:
-                        if isinstance(segment, dict) and 'text' in segment:
-                            text_parts.append(segment['text'].strip())
-                
-                video_text = ' '.join(text_parts)
-                video_name = transcript_file.parent.name
-                
-                # Add to combined data
-                combined_data['combined_transcript']['content']['individual_transcripts'].append({
-                    'source_file': transcript_file.name,
-                    'video_folder': video_name,
-                    'text_content': video_text,
-                    'segment_count': len(text_parts)
-                })
-                
-                combined_data['combined_transcript']['metadata']['source_files'].append({
-                    'file': transcript_file.name,
-                    'video_folder': video_name
-                })
-                
-                # Add to full text
-                if video_text:
-                    separator = f"\n\n--- {video_name} ---\n"
-                    all_text_parts.append(separator + video_text)
-                
-            except Exception as e:
-                print(f"⚠️  Error processing {transcript_file}: {e}")
-                continue
-        
-        # Combine all text
-        combined_data['combined_transcript']['content']['full_text'] = '\n'.join(all_text_parts)
-        
         # Save combined file
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        safe_location = "".join(c for c in location_name if c.isalnum() or c in (' ', '-', '_')).strip()
-        safe_location = safe_location.replace(' ', '_')
+        safe_location = _safe_location(location_name)
         
         filename = f"combined_{safe_location}_{timestamp}.json"
         output_path = self.input_transcripts_dir / filename
         
         try:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(combined_data, f, indent=2, ensure_ascii=False)
+            self._write_combined_file(output_path, location_name, transcript_files)
             
             print(f"✅ Combined transcript saved: {output_path}")
             
             # Update location state
-            states = self.load_location_states()
             current_hash = self.get_location_file_hash(location_name)
             
-            states[location_name] = {
-                'file_hash': current_hash,
-                'last_combined': datetime.now().isoformat(),
-                'combined_file': str(output_path),
-                'transcript_count': len(transcript_files)
-            }
-            
-            self.save_location_states(states)
+            with self._state_lock:
+                states, _ = self._load_once()
+                states[location_name] = {
+                    'file_hash': current_hash,
+                    'last_combined': datetime.now().isoformat(),
+                    'combined_file': str(output_path),
+                    'transcript_count': len(transcript_files)
+                }
+                
+                self._flush()
+                self._text_cache_dirty = True
             
             return True
             
@@ -313,30 +507,83 @@ class AutoTranscriptWatcher:
             return False
     
     def schedule_location_check(self, file_path):
-        """Schedule a location check after a delay to batch multiple files"""
+        """Schedule a location check, batching bursts of file events"""
         location_name = self.get_location_from_path(file_path)
         if not location_name:
             return
         
-        # Cancel existing timer for this location
-        if location_name in self.pending_combinations:
-            self.pending_combinations[location_name].cancel()
-        
-        # Schedule new check
-        import threading
-        timer = threading.Timer(
-            self.combination_delay,
-            self._check_and_combine_location,
-            args=[location_name]
-        )
-        timer.start()
+        self._schedule_location(location_name)
+    
+    def _schedule_location(self, location_name):
+        """Record an event for a location and wake the scheduler"""
+        now = time.monotonic()
+        with self._pending_lock:
+            pending = self.pending_combinations.get(location_name)
+            if pending:
+                pending['last_ts'] = now
+            else:
+                self.pending_combinations[location_name] = {'first_ts': now, 'last_ts': now}
+                print(f"⏰ Scheduled combination check for {location_name} "
+                      f"(after {self.quiet_period}s quiet, at most {self.combination_delay}s)")
+            
+            if self._scheduler_thread is None or not self._scheduler_thread.is_alive():
+                self._scheduler_thread = threading.Thread(
+                    target=self._run_scheduler,
+                    name="combination-scheduler",
+                    daemon=True
+                )
+                self._scheduler_thread.start()
+        
+        self._pending_event.set()
+    
+    def _run_scheduler(self):
+        """Combine pending locations once they go quiet or reach the maximum delay"""
+        while True:
+            now = time.monotonic()
+            due_locations = []
+            timeout = None
+            
+            with self._pending_lock:
+                self._pending_event.clear()
+                for location_name, pending in list(self.pending_combinations.items()):
+                    due_at = min(pending['last_ts'] + self.quiet_period,
+                                 pending['first_ts'] + self.combination_delay)
+                    if due_at <= now:
+                        due_locations.append(location_name)
+                        del self.pending_combinations[location_name]
+                    elif timeout is None or due_at - now < timeout:
+                        timeout = due_at - now
+            
+            for location_name in due_locations:
+                self._check_and_combine_location(location_name)
+            
+            if due_locations:
+                self.save_text_cache()
+            
+            if not due_locations:
+                self._pending_event.wait(timeout)
+    
+    def _location_files_settled(self, location_name):
+        """Check that no transcript of a location is still growing"""
+        location_dir = self.analysis_dir / location_name
+        try:
+            sizes = {entry.path: entry.stat().st_size for _, entry in _iter_transcripts(location_dir)}
+            time.sleep(self.settle_interval)
+            new_sizes = {entry.path: entry.stat().st_size for _, entry in _iter_transcripts(location_dir)}
+        except OSError:
+            # Missing directories are reported by the combination check itself
+            return True
         
-        self.pending_combinations[location_name] = timer
-        print(f"⏰ Scheduled combination check for {location_name} in {self.combination_delay}s")
+        return sizes == new_sizes
     
     def _check_and_combine_location(self, location_name):
         """Check if location needs combination and do it"""
         try:
+            if not self._location_files_settled(location_name):
+                print(f"⏳ {location_name}: Transcripts still being written, rescheduling")
+                self._schedule_location(location_name)
+                return
+            
             if self.check_location_needs_combination(location_name):
                 print(f"🚀 Auto-combining {location_name}...")
                 success = self.combine_location_transcripts(location_name)
@@ -348,36 +595,51 @@ class AutoTranscriptWatcher:
                     self._trigger_smart_pipeline()
                 else:
                     print(f"❌ Failed to combine {location_name}")
-            
-            # Remove from pending
-            if location_name in self.pending_combinations:
-                del self.pending_combinations[location_name]
                 
         except Exception as e:
             print(f"❌ Error in auto-combination for {location_name}: {e}")
     
     def _trigger_smart_pipeline(self):
-        """Trigger the smart pipeline runner"""
-        try:
-            print("🎬 Triggering smart pipeline...")
-            import subprocess
-            import sys
-            
-            result = subprocess.run(
-                [sys.executable, 'smart_pipeline_runner.py'],
-                cwd=self.ai_pipeline_path,
-                capture_output=True,
-                text=True,
-                timeout=300
+        """Trigger the smart pipeline runner, coalescing requests made while it runs"""
+        with self._pipeline_lock:
+            self._pipeline_requested = True
+            if self._pipeline_running:
+                print("⏳ Smart pipeline already running, will run again when it finishes")
+                return
+            self._pipeline_running = True
+            self._pipeline_thread = threading.Thread(
+                target=self._run_smart_pipeline,
+                name="smart-pipeline",
+                daemon=True
             )
+            self._pipeline_thread.start()
+    
+    def _run_smart_pipeline(self):
+        """Run the smart pipeline until no further runs have been requested"""
+        while True:
+            with self._pipeline_lock:
+                if not self._pipeline_requested:
+                    self._pipeline_running = False
+                    return
+                self._pipeline_requested = False
             
-            if result.returncode == 0:
-                print("✅ Smart pipeline completed successfully")
-            else:
-                print(f"⚠️  Smart pipeline had issues: {result.stderr}")
+            try:
+                print("🎬 Triggering smart pipeline...")
+                result = self._runner.run_smart_pipeline()
                 
-        except Exception as e:
-            print(f"⚠️  Could not trigger smart pipeline: {e}")
+                failed = [r for r in result['processed'] if not r['success']]
+                if failed:
+                    print(f"⚠️  Smart pipeline had issues: {len(failed)} file(s) failed")
+                else:
+                    print("✅ Smart pipeline completed successfully")
+                    
+            except Exception as e:
+                print(f"⚠️  Could not run smart pipeline: {e}")
+    
+    def wait_for_smart_pipeline(self):
+        """Block until a triggered smart pipeline run has finished"""
+        if self._pipeline_thread is not None:
+            self._pipeline_thread.join()
     
     def scan_all_locations(self):
         """Scan all existing locations for changes"""
@@ -387,16 +649,37 @@ class AutoTranscriptWatcher:
         
         print("🔍 Scanning all locations for changes...")
         
-        locations_combined = 0
+        # Read state, history and the output directory once for the whole scan
+        states, history = self._load_once()
+        existing = self._index_combined_files()
+        
+        locations_to_combine = []
         for location_dir in self.analysis_dir.iterdir():
             if location_dir.is_dir():
                 location_name = location_dir.name
                 
-                if self.check_location_needs_combination(location_name):
+                if self.check_location_needs_combination(location_name, states=states,
+                                                         history=history, existing=existing):
+                    locations_to_combine.append(location_name)
+        
+        # Combining is mostly file I/O, so locations are combined in parallel
+        locations_combined = 0
+        if locations_to_combine:
+            max_workers = min(self.max_combine_workers, len(locations_to_combine))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {}
+                for location_name in locations_to_combine:
                     print(f"🚀 Combining {location_name}...")
-                    success = self.combine_location_transcripts(location_name)
-                    if success:
-                        locations_combined += 1
+                    futures[executor.submit(self.combine_location_transcripts, location_name)] = location_name
+                
+                for future in as_completed(futures):
+                    try:
+                        if future.result():
+                            locations_combined += 1
+                    except Exception as e:
+                        print(f"❌ Error combining {futures[future]}: {e}")
+            
+            self.save_text_cache()
         
         if locations_combined > 0:
             print(f"✅ Combined {locations_combined} locations")
@@ -445,7 +728,9 @@ def main():
     parser.add_argument('--scan-only', action='store_true', 
                        help='Scan once and exit (no continuous watching)')
     parser.add_argument('--delay', type=int, default=30,
-                       help='Delay in seconds before combining (default: 30)')
+                       help='Maximum delay in seconds before combining a busy location (default: 30)')
+    parser.add_argument('--quiet-period', type=float, default=2,
+                       help='Seconds without new files before combining (default: 2)')
     
     args = parser.parse_args()
     
@@ -453,9 +738,11 @@ def main():
         video_processor_path=args.video_processor_path
     )
     watcher.combination_delay = args.delay
+    watcher.quiet_period = args.quiet_period
     
     if args.scan_only:
         watcher.scan_all_locations()
+        watcher.wait_for_smart_pipeline()
     else:
         watcher.start_watching()
 
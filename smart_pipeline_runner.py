@@ -10,20 +10,55 @@ from datetime import datetime
 from pathlib import Path
 import hashlib
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+HASH_CHUNK_SIZE = 1 << 20  # 1 MiB
+
+def _read_json(path):
+    """Read a JSON file, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(Path(path).read_bytes())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+def _write_json(path, data):
+    """Write data as indented JSON, using orjson when it is installed"""
+    if orjson is not None:
+        Path(path).write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=2)
+
+def _new_content_hasher():
+    """Return a streaming hasher for change detection (xxh3 when installed)"""
+    if xxhash is not None:
+        return xxhash.xxh3_64()
+    return hashlib.md5()
+
 class SmartPipelineRunner:
-    def __init__(self):
-        self.input_dir = Path("Input/transcripts")
-        self.processed_log = Path(".pipeline_processed.json")
-        self.shared_sheet_id_file = Path(".shared_sheet_id.json")
+    def __init__(self, base_path="."):
+        self.base_path = Path(base_path)
+        self.input_dir = self.base_path / "Input" / "transcripts"
+        self.processed_log = self.base_path / ".pipeline_processed.json"
+        self.shared_sheet_id_file = self.base_path / ".shared_sheet_id.json"
+        # file name -> {'mtime', 'size', 'hash'}, seeded from the processing history
+        self._meta_cache = {}
         
     def get_or_create_shared_sheet_id(self):
         """Get existing shared sheet ID or create new one"""
         if self.shared_sheet_id_file.exists():
             try:
-                with open(self.shared_sheet_id_file, 'r') as f:
-                    data = json.load(f)
-                    return data.get('sheet_id')
-            except:
+                data = _read_json(self.shared_sheet_id_file)
+                return data.get('sheet_id')
+            except (OSError, ValueError):
                 pass
         return None
     
@@ -34,31 +69,63 @@ class SmartPipelineRunner:
             'created_at': datetime.now().isoformat()
         }
         try:
-            with open(self.shared_sheet_id_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            _write_json(self.shared_sheet_id_file, data)
         except Exception as e:
             print(f"Warning: Could not save shared sheet ID: {e}")
         
     def get_file_hash(self, file_path):
-        """Generate a hash of file content to detect changes"""
+        """Generate a hash of file content to detect changes
+        
+        Files whose mtime and size match the cached metadata are not re-read.
+        """
+        file_path = Path(file_path)
+        st = file_path.stat()
+        cached = self._meta_cache.get(file_path.name)
+        if cached and cached['mtime'] == st.st_mtime_ns and cached['size'] == st.st_size:
+            return cached['hash']
+        
+        hasher = _new_content_hasher()
         with open(file_path, 'rb') as f:
-            return hashlib.md5(f.read()).hexdigest()
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+                hasher.update(chunk)
+        digest = hasher.hexdigest()
+        
+        self._meta_cache[file_path.name] = {
+            'mtime': st.st_mtime_ns,
+            'size': st.st_size,
+            'hash': digest
+        }
+        return digest
+    
+    def _matches_legacy_hash(self, file_path, file_info):
+        """Check history entries recorded before mtime/size were stored (MD5 digests)"""
+        if 'mtime' in file_info:
+            return False
+        with open(file_path, 'rb') as f:
+            return hashlib.md5(f.read()).hexdigest() == file_info['hash']
     
     def load_processed_history(self):
         """Load history of what's been processed"""
         if self.processed_log.exists():
             try:
-                with open(self.processed_log, 'r') as f:
-                    return json.load(f)
-            except:
+                history = _read_json(self.processed_log)
+            except (OSError, ValueError):
                 pass
+            else:
+                for filename, file_info in history.get('processed_files', {}).items():
+                    if 'mtime' in file_info:
+                        self._meta_cache[filename] = {
+                            'mtime': file_info['mtime'],
+                            'size': file_info['size'],
+                            'hash': file_info['hash']
+                        }
+                return history
         return {'processed_files': {}, 'last_run': None}
     
     def save_processed_history(self, history):
         """Save updated processing history"""
         history['last_run'] = datetime.now().isoformat()
-        with open(self.processed_log, 'w') as f:
-            json.dump(history, f, indent=2)
+        _write_json(self.processed_log, history)
     
     def find_new_combined_files(self):
         """Find combined transcript files that haven't been processed"""
@@ -73,6 +140,7 @@ class SmartPipelineRunner:
         # Find all combined files
         combined_files = list(self.input_dir.glob("combined_*.json"))
         new_files = []
+        upgraded_legacy = False
         
         print(f"🔍 Checking {len(combined_files)} combined files...")
         
@@ -82,7 +150,14 @@ class SmartPipelineRunner:
             
             # Check if this file has been processed with this content
             if file_key in processed_files:
-                if processed_files[file_key]['hash'] == file_hash:
+                file_info = processed_files[file_key]
+                if file_info['hash'] == file_hash:
+                    print(f"✓ {file.name} - already processed (unchanged)")
+                    continue
+                if self._matches_legacy_hash(file, file_info):
+                    # Store the current hash/mtime/size so later runs skip the MD5 pass
+                    file_info.update(self._meta_cache[file_key])
+                    upgraded_legacy = True
                     print(f"✓ {file.name} - already processed (unchanged)")
                     continue
                 else:
@@ -92,6 +167,12 @@ class SmartPipelineRunner:
             
             new_files.append(file)
         
+        if upgraded_legacy:
+            try:
+                self.save_processed_history(history)
+            except OSError as e:
+                print(f"Warning: Could not update processing history: {e}")
+        
         return new_files
     
     def extract_location_from_filename(self, filename):
@@ -117,7 +198,9 @@ class SmartPipelineRunner:
             
             # Import your existing pipeline
             import sys
-            sys.path.append('src')
+            src_dir = str(self.base_path / 'src')
+            if src_dir not in sys.path:
+                sys.path.append(src_dir)
             from complete_oauth_pipeline import CompletePipeline
             
             location = self.extract_location_from_filename(file_path.name)
@@ -129,12 +212,12 @@ class SmartPipelineRunner:
             shared_sheet_id = self.get_or_create_shared_sheet_id()
             
             # Initialize and run pipeline with shared sheet
-            pipeline = CompletePipeline(sheet_id=shared_sheet_id)
-            result = pipeline.process_transcript_to_blog(
-                str(file_path),
-                location=location,
-                date=datetime.now().strftime("%B %Y")
-            )
+            with CompletePipeline(sheet_id=shared_sheet_id) as pipeline:
+                result = pipeline.process_transcript_to_blog(
+                    str(file_path),
+                    location=location,
+                    date=datetime.now().strftime("%B %Y")
+                )
             
             # Save the sheet ID if it's new
             if not shared_sheet_id:
@@ -195,8 +278,11 @@ class SmartPipelineRunner:
             if result['success']:
                 # Mark as processed
                 file_hash = self.get_file_hash(file)
+                file_meta = self._meta_cache[file.name]
                 history['processed_files'][file.name] = {
                     'hash': file_hash,
+                    'mtime': file_meta['mtime'],
+                    'size': file_meta['size'],
                     'processed_at': datetime.now().isoformat(),
                     'location': result['location'],
                     'doc_url': result['doc_url']
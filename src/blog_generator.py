@@ -1,49 +1,37 @@
+import asyncio
 import json
+import logging
 import os
+import re
+import reprlib
 from datetime import datetime
 import anthropic
 from dotenv import load_dotenv
+from llm_cache import LLMResponseCache
 
 # Load environment variables
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+_WORD_RE = re.compile(r'\S+')
+
+# Length-limited repr so logging a huge Claude response doesn't dump the whole body
+_response_repr = reprlib.Repr()
+_response_repr.maxstring = 500
+
 class BlogGenerator:
-    def __init__(self):
-        self.anthropic_client = anthropic.Anthropic(api_key=os.environ["ANTHROPIC_API_KEY"])
-    
-    def generate_trip_report(self, transcript_data, location=None, date=None):
-        """
-        Generate a trip report blog post from video transcript data.
-        """
-        # Extract text from transcript segments
-        full_text = self._extract_text_from_transcript(transcript_data)
-        
-        # Generate the blog post using Claude
-        blog_content = self._generate_blog_with_claude(full_text, location, date)
-        
-        return blog_content
-    
-    def _extract_text_from_transcript(self, transcript_data):
-        """Extract and combine text from transcript segments"""
-        if isinstance(transcript_data, list):
-            return " ".join([segment.get('text', '') for segment in transcript_data])
-        elif isinstance(transcript_data, dict):
-            if 'filtered_transcription' in transcript_data:
-                return " ".join([segment.get('text', '') for segment in transcript_data['filtered_transcription']])
-            elif 'text' in transcript_data:
-                return transcript_data['text']
-        
-        return str(transcript_data)
+    model = "claude-sonnet-4-20250514"
+    _json_decoder = json.JSONDecoder()
     
-    def _generate_blog_with_claude(self, transcript_text, location, date):
-        """Use Claude to generate an engaging trip report"""
-        
-        prompt = f"""You are an expert travel blogger who creates inspiring, SEO-optimized trip reports written in a personal journal style.
+    _PROMPT_HEAD = """You are an expert travel blogger who creates inspiring, SEO-optimized trip reports written in a personal journal style.
 
 Transform this raw video transcript into a compelling first-person blog post:
 
 TRANSCRIPT:
-{transcript_text}
+"""
+    
+    _PROMPT_MIDDLE = """
 
 WRITING REQUIREMENTS:
 - Write in first person as if reading from a personal journal
@@ -61,11 +49,12 @@ SEO REQUIREMENTS:
 - Create compelling meta description under 150 characters
 - Suggest relevant tags for outdoor/nature content
 
-{f"LOCATION: {location}" if location else ""}
-{f"DATE: {date}" if date else ""}
+"""
+    
+    _PROMPT_TAIL = """
 
 Respond with a JSON object in this exact format:
-{{
+{
   "title": "SEO-optimized blog post title with location keywords",
   "meta_description": "Under 150 character meta description with location keywords",
   "content": "Complete journal-style blog post under 500 words with [IMAGE: description] placeholders and inspirational quote",
@@ -74,50 +63,168 @@ Respond with a JSON object in this exact format:
   "word_count": 450,
   "primary_keyword": "main SEO keyword phrase",
   "environmentalist_quote_author": "name of quoted environmentalist"
-}}
+}
 
 DO NOT include any markdown formatting like ```json or ```. Respond with ONLY the JSON object."""
+    
+    def __init__(self, response_cache=None):
+        self.api_key = os.environ["ANTHROPIC_API_KEY"]
+        self.response_cache = response_cache if response_cache is not None else self._open_response_cache()
+        self._anthropic_client = None
+        self._client_loop = None
+    
+    @staticmethod
+    def _open_response_cache():
+        """Open the default response cache; it's only an optimization, so run without one if it fails"""
+        try:
+            return LLMResponseCache()
+        except Exception as e:
+            print(f"Warning: Could not open Claude response cache, continuing without it: {e}")
+            return None
+    
+    @property
+    def anthropic_client(self):
+        """Async Claude client for the running event loop"""
+        # The client's connection pool is tied to the loop that created it, so a new
+        # client is made whenever we're called from a different loop (e.g. each asyncio.run)
+        loop = asyncio.get_running_loop()
+        if self._anthropic_client is None or self._client_loop is not loop:
+            self._anthropic_client = anthropic.AsyncAnthropic(api_key=self.api_key)
+            self._client_loop = loop
+        return self._anthropic_client
+    
+    async def aclose(self):
+        """Close the Claude client created for the running event loop"""
+        client, loop = self._anthropic_client, self._client_loop
+        self._anthropic_client = None
+        self._client_loop = None
+        if client is not None and loop is asyncio.get_running_loop():
+            await client.close()
+    
+    def run(self, coro):
+        """asyncio.run(coro), closing the Claude client made for that loop before the loop shuts down"""
+        async def run_and_close():
+            try:
+                return await coro
+            finally:
+                await self.aclose()
+        
+        return asyncio.run(run_and_close())
+    
+    def generate_trip_report(self, transcript_data, location=None, date=None):
+        """
+        Generate a trip report blog post from video transcript data.
+        """
+        return self.run(self.generate_trip_report_async(transcript_data, location, date))
+    
+    async def generate_trip_report_async(self, transcript_data, location=None, date=None, transcript_text=None,
+                                         generated_at=None):
+        """
+        Generate a trip report without blocking the event loop, so several can run with asyncio.gather.
+        Pass transcript_text if the caller already extracted it with extract_transcript, and
+        generated_at to stamp the post with the caller's run time.
+        """
+        # Extract text from transcript segments
+        if transcript_text is None:
+            transcript_text, _ = self.extract_transcript(transcript_data)
+        
+        generated_date = (generated_at or datetime.now()).isoformat()
+        
+        # Generate the blog post using Claude
+        blog_content = await self._generate_blog_with_claude(transcript_text, location, date, generated_date)
+        
+        return blog_content
+    
+    def extract_transcript(self, transcript_data):
+        """Extract and combine text from transcript segments; returns (text, segment_count)"""
+        if isinstance(transcript_data, list):
+            return " ".join(segment.get('text', '') for segment in transcript_data), len(transcript_data)
+        elif isinstance(transcript_data, dict):
+            if 'combined_transcript' in transcript_data:
+                # Combined location files only store per-video text; join it back on read
+                transcripts = transcript_data['combined_transcript']['content']['individual_transcripts']
+                text = "\n".join(f"\n\n--- {t['video_folder']} ---\n{t['text_content']}" for t in transcripts if t['text_content'])
+                return text, sum(t.get('segment_count', 0) for t in transcripts)
+            elif 'filtered_transcription' in transcript_data:
+                segments = transcript_data['filtered_transcription']
+                return " ".join(segment.get('text', '') for segment in segments), len(segments)
+            elif 'text' in transcript_data:
+                return transcript_data['text'], 1
+        
+        return str(transcript_data), 0
+    
+    def _max_output_tokens(self, transcript_text):
+        """Output budget for a post under 500 words (~700 tokens plus JSON fields), with headroom for longer trips"""
+        return min(2000, 1200 + len(transcript_text) // 200)
+    
+    async def _generate_blog_with_claude(self, transcript_text, location, date, generated_date):
+        """Use Claude to generate an engaging trip report"""
+        
+        # Only the transcript and the optional location/date lines change between calls
+        prompt = "".join([
+            self._PROMPT_HEAD,
+            transcript_text,
+            self._PROMPT_MIDDLE,
+            f"LOCATION: {location}" if location else "",
+            "\n",
+            f"DATE: {date}" if date else "",
+            self._PROMPT_TAIL
+        ])
+        
+        # Identical re-runs reuse the earlier response instead of paying for another call
+        cache_key = LLMResponseCache.make_key(self.model, prompt)
+        cached_blog = None
+        if self.response_cache is not None:
+            try:
+                cached_blog = self.response_cache.get(cache_key)
+            except Exception as e:
+                print(f"Warning: Could not read Claude response cache: {e}")
+        if cached_blog is not None:
+            print("♻️ Using cached Claude response")
+            cached_blog['generated_date'] = generated_date
+            return cached_blog
         
         try:
-            response = self.anthropic_client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=4000,
+            response = await self.anthropic_client.messages.create(
+                model=self.model,
+                max_tokens=self._max_output_tokens(transcript_text),
                 temperature=0.7,
                 messages=[{"role": "user", "content": prompt}]
             )
             
-            response_text = response.content[0].text.strip()
+            if response.stop_reason == 'max_tokens':
+                print("⚠️ Claude response hit max_tokens and may be truncated")
             
-            # Clean up the response - remove any markdown formatting
-            if response_text.startswith('```json'):
-                response_text = response_text.replace('```json', '').replace('```', '').strip()
-            elif response_text.startswith('```'):
-                response_text = response_text.replace('```', '').strip()
+            response_text = response.content[0].text.strip()
             
-            # Find JSON object if there's extra text
-            start_idx = response_text.find('{')
-            end_idx = response_text.rfind('}') + 1
-            if start_idx != -1 and end_idx != 0:
-                response_text = response_text[start_idx:end_idx]
+            # Decode the first JSON object in one pass; any ```json fence or surrounding text is skipped
+            start_idx = max(response_text.find('{'), 0)
             
-            print(f"Cleaned Claude response: {response_text[:200]}...")
+            logger.debug("Claude response: %s", _response_repr.repr(response_text))
             
-            blog_data = json.loads(response_text)
+            blog_data, _ = self._json_decoder.raw_decode(response_text, start_idx)
             
-            blog_data['generated_date'] = datetime.now().isoformat()
+            blog_data['generated_date'] = generated_date
             blog_data['source_transcript_length'] = len(transcript_text)
             
-            return blog_data
-            
         except json.JSONDecodeError as e:
             print(f"Error parsing Claude JSON response: {e}")
-            print(f"Raw response: {response_text}")
-            return self._create_fallback_blog(transcript_text, location, date)
+            logger.error("Raw response: %s", _response_repr.repr(response_text))
+            return self._create_fallback_blog(transcript_text, location, date, generated_date)
         except Exception as e:
             print(f"Error calling Claude API: {e}")
-            return self._create_fallback_blog(transcript_text, location, date)
+            return self._create_fallback_blog(transcript_text, location, date, generated_date)
+        
+        # Kept out of the API try: a cache write failure must not throw away a paid-for response
+        if self.response_cache is not None:
+            try:
+                self.response_cache.put(cache_key, blog_data)
+            except Exception as e:
+                print(f"Warning: Could not cache Claude response: {e}")
+        
+        return blog_data
     
-    def _create_fallback_blog(self, transcript_text, location, date):
+    def _create_fallback_blog(self, transcript_text, location, date, generated_date):
         """Create a basic blog structure if Claude fails"""
         return {
             "title": f"Trip Report: {location or 'Adventure'}" + (f" - {date}" if date else ""),
@@ -125,8 +232,8 @@ DO NOT include any markdown formatting like ```json or ```. Respond with ONLY th
             "content": f"# Trip Report\n\n{transcript_text[:500]}...",
             "tags": ["travel", "adventure", "trip-report"],
             "suggested_images": ["landscape", "activity", "personal"],
-            "word_count": len(transcript_text.split()),
-            "generated_date": datetime.now().isoformat(),
+            "word_count": sum(1 for _ in _WORD_RE.finditer(transcript_text)),
+            "generated_date": generated_date,
             "source_transcript_length": len(transcript_text),
             "note": "Fallback content - Claude API unavailable"
         }
@@ -1,53 +1,143 @@
+import asyncio
 import os
+import re
 import json
+import mmap
+import threading
 from datetime import datetime
+from functools import lru_cache
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from blog_generator import BlogGenerator
 from google_oauth_integration import GoogleOAuthIntegration
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 load_dotenv()
 
+# Characters other than letters, digits, '_', '-' and ' ' are dropped from backup filenames
+_UNSAFE_TITLE_CHARS = re.compile(r'[^\w\- ]')
+
+# Static parts of the Slack message, built once and shared (never mutated) by every notification
+_SLACK_HEADER_BLOCK = {
+    "type": "header",
+    "text": {
+        "type": "plain_text",
+        "text": "🎉 New Blog Post Ready for Review!"
+    }
+}
+_SLACK_DOC_BUTTON_TEXT = {"type": "plain_text", "text": "📄 View Google Doc"}
+_SLACK_SHEET_BUTTON_TEXT = {"type": "plain_text", "text": "📊 View Tracking Sheet"}
+
+# Google API clients are shared by every pipeline and aren't thread-safe
+_GOOGLE_API_LOCK = threading.Lock()
+
+@lru_cache(maxsize=None)
+def _shared_blog_generator():
+    """One BlogGenerator per process, so its response cache connection is reused (the Claude client is per event loop)"""
+    return BlogGenerator()
+
+@lru_cache(maxsize=None)
+def _shared_google_integration():
+    """One GoogleOAuthIntegration per process, so OAuth checks and API discovery run once"""
+    return GoogleOAuthIntegration()
+
 class CompletePipeline:
     def __init__(self, sheet_id=None):
-        self.blog_generator = BlogGenerator()
-        self.google_integration = GoogleOAuthIntegration()
+        self.blog_generator = _shared_blog_generator()
+        self.google_integration = _shared_google_integration()
         self.slack_webhook = os.environ.get("SLACK_WEBHOOK_URL")
         self.sheet_id = sheet_id  # Optional: reuse existing tracking sheet
+        
+        # Pooled session so repeated Slack posts reuse the keep-alive connection.
+        # Webhook POSTs aren't idempotent, so only retry when the message can't have been
+        # delivered: connection failures and 429 rate limits (never read errors or 5xx)
+        self._http = requests.Session()
+        self._http.mount('https://', HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(total=3, read=0, backoff_factor=0.3, status_forcelist=[429],
+                              allowed_methods=frozenset(['POST']))
+        ))
+    
+    def close(self):
+        """Close pooled HTTP connections"""
+        self._http.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
     
     def process_transcript_to_blog(self, transcript_file_path, location=None, date=None):
         """Complete pipeline: transcript -> blog -> Google Doc -> Sheets -> Slack"""
+        return self.blog_generator.run(self.process_transcript_to_blog_async(transcript_file_path, location, date))
+    
+    def process_transcripts_to_blogs(self, transcript_jobs):
+        """Run the pipeline for several (transcript_file_path, location, date) jobs with concurrent blog generation"""
+        return self.blog_generator.run(self.process_transcripts_to_blogs_async(transcript_jobs))
+    
+    async def process_transcripts_to_blogs_async(self, transcript_jobs):
+        """Async version of process_transcripts_to_blogs; failed jobs come back as exceptions"""
+        return await asyncio.gather(
+            *[self.process_transcript_to_blog_async(path, location, date) for path, location, date in transcript_jobs],
+            return_exceptions=True
+        )
+    
+    async def process_transcript_to_blog_async(self, transcript_file_path, location=None, date=None):
+        """Async version of process_transcript_to_blog"""
         
         print("🚀 Starting complete content pipeline...")
+        run_time = datetime.now()  # one timestamp for the whole run
         
         # 1. Load transcript
         print("📄 Loading transcript...")
-        with open(transcript_file_path, 'r') as f:
-            transcript_data = json.load(f)
-        print(f"✅ Loaded transcript with {len(transcript_data.get('filtered_transcription', transcript_data))} segments")
+        if orjson is not None:
+            # Parse straight from the page cache instead of copying the file into a bytes object
+            with open(transcript_file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    transcript_data = orjson.loads(view)
+        else:
+            with open(transcript_file_path, 'r') as f:
+                transcript_data = json.load(f)
+        transcript_text, segment_count = self.blog_generator.extract_transcript(transcript_data)
+        print(f"✅ Loaded transcript with {segment_count} segments")
         
         # 2. Generate blog
         print("✍️ Generating blog post with AI...")
-        blog_data = self.blog_generator.generate_trip_report(transcript_data, location, date)
+        blog_data = await self.blog_generator.generate_trip_report_async(
+            transcript_data, location, date, transcript_text=transcript_text, generated_at=run_time
+        )
         print(f"✅ Generated {blog_data.get('word_count', 'N/A')} word blog post")
         
-        # 3. Create Google Doc
+        # Blocking Google/Slack/file calls run on the default thread pool
+        # (run_in_executor rather than asyncio.to_thread, which needs Python 3.9)
+        loop = asyncio.get_running_loop()
+        
+        # 3. Create Google Doc while saving the local backup (independent I/O)
         print("📄 Creating Google Doc...")
-        doc_info = self.google_integration.create_blog_doc(blog_data)
+        print("💾 Saving local backup...")
+        doc_info, local_files = await asyncio.gather(
+            loop.run_in_executor(None, self._call_google, self.google_integration.create_blog_doc, blog_data),
+            loop.run_in_executor(None, self._save_local_backup, blog_data, run_time)
+        )
         
-        # 4. Log to tracking spreadsheet
+        # 4. Log to tracking spreadsheet (needs the doc link)
         print("📊 Updating tracking spreadsheet...")
-        sheet_info = self.google_integration.create_or_update_tracking_sheet(
+        sheet_info = await loop.run_in_executor(
+            None, self._call_google, self.google_integration.create_or_update_tracking_sheet,
             blog_data, doc_info, self.sheet_id
         )
         
-        # 5. Save locally as backup
-        print("💾 Saving local backup...")
-        local_files = self._save_local_backup(blog_data)
-        
-        # 6. Send comprehensive Slack notification
+        # 5. Send comprehensive Slack notification (needs both links)
         print("📢 Sending Slack notification...")
-        self._send_slack_notification(blog_data, doc_info, sheet_info)
+        await loop.run_in_executor(None, self._send_slack_notification, blog_data, doc_info, sheet_info)
         
         print("✅ Complete pipeline finished!")
         return {
@@ -57,11 +147,17 @@ class CompletePipeline:
             'local_files': local_files
         }
     
-    def _save_local_backup(self, blog_data):
+    def _call_google(self, method, *args):
+        """Run a Google API call; the API clients aren't thread-safe, so calls are serialized"""
+        with _GOOGLE_API_LOCK:
+            return method(*args)
+    
+    def _save_local_backup(self, blog_data, run_time=None):
         """Save local backup files"""
         
-        timestamp = datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
-        safe_title = "".join(c for c in blog_data['title'][:30] if c.isalnum() or c in (' ', '-', '_')).rstrip()
+        ts = run_time or datetime.now()
+        timestamp = f"{ts.year:04d}-{ts.month:02d}-{ts.day:02d}_{ts.hour:02d}-{ts.minute:02d}-{ts.second:02d}"
+        safe_title = _UNSAFE_TITLE_CHARS.sub('', blog_data['title'][:30]).rstrip()
         base_filename = f"{safe_title}_{timestamp}"
         
         # Create directories
@@ -69,8 +165,19 @@ class CompletePipeline:
         
         # Save as JSON
         json_file = f"../output/drafts/{base_filename}.json"
-        with open(json_file, 'w') as f:
-            json.dump(blog_data, f, indent=2)
+        if orjson is not None:
+            data = orjson.dumps(blog_data, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(blog_data, indent=2).encode('utf-8')
+        
+        # Write the serialized bytes straight to the fd, skipping the text/buffered I/O layers
+        fd = os.open(json_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
         
         return {'json_file': json_file}
     
@@ -80,13 +187,7 @@ class CompletePipeline:
         message = {
             "text": "📝 New Blog Post Created!",
             "blocks": [
-                {
-                    "type": "header",
-                    "text": {
-                        "type": "plain_text",
-                        "text": "🎉 New Blog Post Ready for Review!"
-                    }
-                },
+                _SLACK_HEADER_BLOCK,
                 {
                     "type": "section",
                     "fields": [
@@ -127,19 +228,13 @@ class CompletePipeline:
                     "elements": [
                         {
                             "type": "button",
-                            "text": {
-                                "type": "plain_text",
-                                "text": "📄 View Google Doc"
-                            },
+                            "text": _SLACK_DOC_BUTTON_TEXT,
                             "url": doc_info['doc_url'],
                             "style": "primary"
                         },
                         {
                             "type": "button",
-                            "text": {
-                                "type": "plain_text",
-                                "text": "📊 View Tracking Sheet"
-                            },
+                            "text": _SLACK_SHEET_BUTTON_TEXT,
                             "url": sheet_info['sheet_url']
                         }
                     ]
@@ -148,7 +243,7 @@ class CompletePipeline:
         }
         
         try:
-            response = requests.post(self.slack_webhook, json=message)
+            response = self._http.post(self.slack_webhook, json=message, timeout=5)
             if response.status_code == 200:
                 print("✅ Slack notification sent!")
             else:
@@ -0,0 +1,50 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+
+class LLMResponseCache:
+    """SQLite-backed cache of generated blog data, keyed by the exact model + prompt sent to Claude"""
+    
+    def __init__(self, db_path='../output/cache/llm_cache.sqlite'):
+        self.db_path = db_path
+        os.makedirs(os.path.dirname(db_path) or '.', exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, blog_data TEXT NOT NULL, created_at TEXT NOT NULL)"
+        )
+        self._conn.commit()
+    
+    @staticmethod
+    def make_key(model, prompt):
+        """Hash the request so identical re-runs map to the same row"""
+        return hashlib.sha256(f"{model}\0{prompt}".encode('utf-8')).hexdigest()
+    
+    def get(self, key):
+        """Return cached blog data for key, or None on a miss"""
+        with self._lock:
+            row = self._conn.execute("SELECT blog_data FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        try:
+            return json.loads(row[0])
+        except ValueError:
+            return None
+    
+    def put(self, key, blog_data):
+        """Store blog data for key"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, blog_data, created_at) VALUES (?, ?, ?)",
+                (key, json.dumps(blog_data, ensure_ascii=False), datetime.now().isoformat())
+            )
+            self._conn.commit()
+    
+    def close(self):
+        """Close the underlying database connection"""
+        with self._lock:
+            self._conn.close()
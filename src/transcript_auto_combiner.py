@@ -4,13 +4,88 @@ Auto Transcript Combiner for AI Content Pipeline
 Combines transcript files from video-processor and triggers your existing pipeline
 """
 
+import io
 import os
+import re
+import sys
 import json
 import glob
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 import shutil
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_TRAILING_NUM = re.compile(r'(\d+)$')
+
+@lru_cache(maxsize=4096)
+def _video_num(folder_name):
+    """Video number from folder names like "Discovery Park July 9_1" or "mt washington 2", for sorting"""
+    last_part = folder_name.rpartition('_')[2]
+    if last_part.isdecimal():
+        return int(last_part)
+    # Try extracting from end of name
+    match = _TRAILING_NUM.search(folder_name)
+    if match:
+        return int(match.group(1))
+    return 999  # Put unmatched files at the end
+
+class _SafeCharTable(dict):
+    """str.translate table that deletes characters not allowed in combined filenames
+    
+    Copy of the table in auto_transcript_watcher.py (src/ and the top-level scripts don't
+    import each other); keep the two in sync so both name combined files the same way.
+    """
+    
+    def __missing__(self, codepoint):
+        char = chr(codepoint)
+        value = codepoint if char.isalnum() or char in ' -_' else None
+        self[codepoint] = value
+        return value
+
+_SAFE_CHARS = _SafeCharTable()
+
+def _mtime_ns(path):
+    """Return a file's st_mtime_ns, or None if it doesn't exist"""
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+def _loads(data):
+    """Parse JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _dumps(data):
+    """Serialize data to indented UTF-8 JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+def _extract_suggestion(data):
+    """Segments from a Claude filtered transcript (best quality)"""
+    if type(data) is list:
+        return data
+    return data.get('filtered_transcription', data)
+
+def _extract_list(data):
+    """Segments from a locally filtered or raw transcription"""
+    return data if type(data) is list else [data]
+
+# Filename suffix -> (processing type, segment extractor)
+_HANDLERS = {
+    '_suggestion.json': ('claude_filtered', _extract_suggestion),
+    '_locally_filtered.json': ('locally_filtered', _extract_list),
+    '_transcription.json': ('raw_transcription', _extract_list),
+}
+
 class TranscriptAutoCombiner:
     def __init__(self, video_processor_path="../video-processor", content_pipeline_path="."):
         """
@@ -29,6 +104,61 @@ class TranscriptAutoCombiner:
         
         # Track processed files
         self.processed_log = self.content_pipeline_path / ".processed_transcripts.json"
+        # Locations are appended here as they finish; folded into processed_log at the end of run()
+        self.processed_journal = self.content_pipeline_path / ".processed_transcripts.log"
+        self._journal = None
+        self._processed_cache = frozenset()
+        self._processed_mtime = None
+        
+        # CompletePipeline is created on first use, shared by every location and closed at the end of run()
+        self._pipeline = None
+    
+    def _read_processed_combinations(self):
+        """
+        Read processed locations from the JSON snapshot plus the append-only journal.
+        
+        Returns:
+            frozenset: Names of locations that were already combined
+        """
+        processed = set()
+        try:
+            with open(self.processed_log, 'rb') as f:
+                processed.update(_loads(f.read()).get('processed_combinations', []))
+        except FileNotFoundError:
+            pass
+        
+        try:
+            with open(self.processed_journal, 'rb') as f:
+                for line in f:
+                    try:
+                        processed.add(_loads(line)['location'])
+                    except (ValueError, KeyError, TypeError):
+                        continue  # blank or partially written line
+        except FileNotFoundError:
+            pass
+        
+        return frozenset(processed)
+    
+    def _load_processed_combinations(self):
+        """
+        Load the set of already processed locations, re-reading only when the snapshot or journal has changed.
+        
+        Returns:
+            frozenset: Names of locations that were already combined
+        """
+        mtimes = (_mtime_ns(self.processed_log), _mtime_ns(self.processed_journal))
+        if mtimes == (None, None):
+            return frozenset()
+        
+        if mtimes != self._processed_mtime:
+            try:
+                self._processed_cache = self._read_processed_combinations()
+                self._processed_mtime = mtimes
+            except Exception as e:
+                print(f"Warning: Could not load processed combinations log: {e}")
+                return frozenset()
+        
+        return self._processed_cache
     
     def find_new_transcript_files_by_location(self):
         """
@@ -38,72 +168,82 @@ class TranscriptAutoCombiner:
             Dict[str, List[Path]]: Dictionary mapping location names to lists of new transcript files
         """
         # Load previously processed combinations
-        processed_combinations = set()
-        if self.processed_log.exists():
-            try:
-                with open(self.processed_log, 'r') as f:
-                    data = json.load(f)
-                    processed_combinations = set(data.get('processed_combinations', []))
-            except Exception as e:
-                print(f"Warning: Could not load processed combinations log: {e}")
+        processed_combinations = self._load_processed_combinations()
         
         # Find all transcript files from video processor grouped by location
-        analysis_dir = self.video_processor_path / "analysis"
+        # Plain strings on the scan path; Path objects are only built for the result
+        analysis_dir = os.path.join(self.video_processor_path, "analysis")
         location_groups = {}
         
-        if not analysis_dir.exists():
+        if not os.path.exists(analysis_dir):
             print(f"Analysis directory not found: {analysis_dir}")
             return {}
         
         # Scan each location directory (Discovery Park July 9, Mt Washington, etc.)
-        for location_dir in analysis_dir.iterdir():
-            if not location_dir.is_dir():
-                continue
-                
-            location_name = location_dir.name
-            print(f"Scanning location: {location_name}")
+        # os.scandir reports entry types from the directory read, so no extra stat per entry
+        with os.scandir(analysis_dir) as entries:
+            location_entries = [entry for entry in entries if entry.is_dir()]
+        
+        for location_entry in location_entries:
+            location_name = location_entry.name
+            # Messages are buffered and written once per location rather than per folder
+            log = [f"Scanning location: {location_name}"]
             
             # Check if this location has already been processed
             if location_name in processed_combinations:
-                print(f"  ✓ {location_name} already processed, skipping")
+                log.append(f"  ✓ {location_name} already processed, skipping")
+                sys.stdout.write('\n'.join(log) + '\n')
                 continue
             
             # Find all individual video folders for this location
             location_files = []
-            for video_dir in location_dir.iterdir():
-                if not video_dir.is_dir():
-                    continue
-                    
-                print(f"  Checking video folder: {video_dir.name}")
+            with os.scandir(location_entry.path) as entries:
+                video_entries = [entry for entry in entries if entry.is_dir()]
+            
+            for video_entry in video_entries:
+                log.append(f"  Checking video folder: {video_entry.name}")
+                
+                # Classify the folder's files by suffix in a single directory pass
+                suggestion_files = []
+                filtered_files = []
+                transcription_files = []
+                with os.scandir(video_entry.path) as entries:
+                    for entry in entries:
+                        name = entry.name
+                        if name.endswith("_suggestion.json"):
+                            suggestion_files.append(entry.path)
+                        elif name.endswith("_locally_filtered.json"):
+                            filtered_files.append(entry.path)
+                        elif name.endswith("_transcription.json"):
+                            transcription_files.append(entry.path)
                 
                 # Look for transcript files in order of preference
                 transcript_files = []
                 
                 # 1. Prefer Claude-filtered suggestions (the suggestion.json from your video processor)
-                suggestion_files = list(video_dir.glob("*_suggestion.json"))
                 if suggestion_files:
                     transcript_files.extend(suggestion_files)
-                    print(f"    Found {len(suggestion_files)} Claude-filtered suggestion files")
+                    log.append(f"    Found {len(suggestion_files)} Claude-filtered suggestion files")
                 
                 # 2. Fall back to locally filtered
-                elif list(video_dir.glob("*_locally_filtered.json")):
-                    filtered_files = list(video_dir.glob("*_locally_filtered.json"))
+                elif filtered_files:
                     transcript_files.extend(filtered_files)
-                    print(f"    Found {len(filtered_files)} locally filtered files")
+                    log.append(f"    Found {len(filtered_files)} locally filtered files")
                 
                 # 3. Use main transcription files (this is your primary output)
-                elif list(video_dir.glob("*_transcription.json")):
-                    transcription_files = list(video_dir.glob("*_transcription.json"))
+                elif transcription_files:
                     transcript_files.extend(transcription_files)
-                    print(f"    Found {len(transcription_files)} transcription files")
+                    log.append(f"    Found {len(transcription_files)} transcription files")
                 
                 location_files.extend(transcript_files)
             
             if location_files:
-                location_groups[location_name] = location_files
-                print(f"  📁 {location_name}: {len(location_files)} transcript files ready for combination")
+                location_groups[location_name] = [Path(path) for path in location_files]
+                log.append(f"  📁 {location_name}: {len(location_files)} transcript files ready for combination")
             else:
-                print(f"  ℹ️  {location_name}: No transcript files found")
+                log.append(f"  ℹ️  {location_name}: No transcript files found")
+            
+            sys.stdout.write('\n'.join(log) + '\n')
         
         print(f"\n📊 Summary: Found {len(location_groups)} location groups with new transcripts")
         return location_groups
@@ -119,8 +259,8 @@ class TranscriptAutoCombiner:
             Dict: Extracted content with metadata
         """
         try:
-            with open(transcript_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(transcript_file, 'rb') as f:
+                data = _loads(f.read())
             
             # Handle different transcript formats from your video processor
             transcript_content = {
@@ -132,35 +272,26 @@ class TranscriptAutoCombiner:
             }
             
             # Determine file type and extract content
-            if '_suggestion.json' in transcript_file.name:
-                # Claude filtered transcripts (best quality)
-                transcript_content['processing_type'] = 'claude_filtered'
-                if isinstance(data, list):
-                    transcript_content['segments'] = data
-                else:
-                    transcript_content['segments'] = data.get('filtered_transcription', data)
-            
-            elif '_locally_filtered.json' in transcript_file.name:
-                # Locally filtered transcripts
-                transcript_content['processing_type'] = 'locally_filtered'
-                transcript_content['segments'] = data if isinstance(data, list) else [data]
-            
-            elif '_transcription.json' in transcript_file.name:
-                # Raw transcriptions
-                transcript_content['processing_type'] = 'raw_transcription'
-                transcript_content['segments'] = data if isinstance(data, list) else [data]
+            name = transcript_file.name
+            for suffix, (processing_type, extract_segments) in _HANDLERS.items():
+                if name.endswith(suffix):
+                    transcript_content['processing_type'] = processing_type
+                    transcript_content['segments'] = extract_segments(data)
+                    break
             
             # Extract full text from segments
             segments = transcript_content['segments']
-            if segments and isinstance(segments, list):
-                full_text_parts = []
+            if segments and type(segments) is list:
+                full_text = io.StringIO()
                 for segment in segments:
-                    if isinstance(segment, dict) and 'text' in segment:
+                    if type(segment) is dict and 'text' in segment:
                         text = segment['text'].strip()
                         if text:
-                            full_text_parts.append(text)
+                            if full_text.tell():
+                                full_text.write(' ')
+                            full_text.write(text)
                 
-                transcript_content['full_text'] = ' '.join(full_text_parts)
+                transcript_content['full_text'] = full_text.getvalue()
             
             return transcript_content
             
@@ -168,22 +299,25 @@ class TranscriptAutoCombiner:
             print(f"Error reading transcript file {transcript_file}: {e}")
             return None
     
-    def combine_transcripts_for_location(self, location_name, transcript_files):
+    def combine_transcripts_for_location(self, location_name, transcript_files, run_time=None, executor=None):
         """
         Combine transcript files for a specific location/trip.
         
         Args:
             location_name (str): Name of the location (e.g., "Mt Washington", "Discovery Park July 9")
             transcript_files (List[Path]): List of transcript files for this location
+            run_time (datetime): Timestamp of the current run (defaults to now)
+            executor (ThreadPoolExecutor): Shared pool for reading files (a private one is used if None)
             
         Returns:
             Dict: Combined transcript data for this location
         """
+        run_time = run_time or datetime.now()
         combined_data = {
             'combined_transcript': {
                 'metadata': {
                     'location': location_name,
-                    'created_at': datetime.now().isoformat(),
+                    'created_at': run_time.isoformat(),
                     'total_source_files': len(transcript_files),
                     'source_files': [],
                     'combiner_version': '1.0'
@@ -195,44 +329,89 @@ class TranscriptAutoCombiner:
             }
         }
         
-        all_text_parts = []
+        # Written incrementally rather than collected in a list and joined
+        full_text = io.StringIO()
         
         # Sort files by video number/name for consistent ordering
-        def extract_video_number(file_path):
-            # Extract number from patterns like "Discovery Park July 9_1", "mt washington 2", etc.
-            try:
-                parts = file_path.parent.name.split('_')
-                if parts:
-                    last_part = parts[-1]
-                    if last_part.isdigit():
-                        return int(last_part)
-                # Try extracting from end of name
-                import re
-                match = re.search(r'(\d+)
+        sorted_files = sorted(transcript_files, key=lambda f: _video_num(f.parent.name))
+        
+        # Read and parse files concurrently; map keeps results in sorted order
+        if executor is not None:
+            contents = list(executor.map(self.extract_transcript_content, sorted_files))
+        else:
+            with ThreadPoolExecutor(max_workers=min(8, len(sorted_files)) or 1) as file_executor:
+                contents = list(file_executor.map(self.extract_transcript_content, sorted_files))
+        
+        individual_transcripts = combined_data['combined_transcript']['content']['individual_transcripts']
+        source_files = combined_data['combined_transcript']['metadata']['source_files']
+        
+        for transcript_file, content in zip(sorted_files, contents):
+            if not content:
+                continue
+            
+            video_folder = transcript_file.parent.name
+            source_file = content['source_file']
+            processing_type = content['processing_type']
+            text = content['full_text']
+            
+            # Add to individual transcripts
+            individual_transcripts.append({
+                'source_file': source_file,
+                'video_folder': video_folder,
+                'file_path': content['file_path'],
+                'processing_type': processing_type,
+                'text_content': text,
+                'segment_count': len(content['segments'])
+            })
+            
+            # Add to metadata
+            source_files.append({
+                'file': source_file,
+                'video_folder': video_folder,
+                'type': processing_type
+            })
+            
+            # Add text content with video separator
+            if text:
+                if full_text.tell():
+                    full_text.write('\n')
+                full_text.write(f"\n\n--- {video_folder} ({processing_type}) ---\n")
+                full_text.write(text)
+        
+        # Combine all text
+        combined_data['combined_transcript']['content']['full_text'] = full_text.getvalue()
+        
+        return combined_data
     
-    def save_combined_transcript_for_location(self, location_name, combined_data):
+    def save_combined_transcript_for_location(self, location_name, combined_data, run_time=None):
         """
         Save the combined transcript for a specific location.
         
         Args:
             location_name (str): Name of the location
             combined_data (Dict): Combined transcript data
+            run_time (datetime): Timestamp of the current run (defaults to now)
             
         Returns:
             Path: Path to saved combined transcript
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = (run_time or datetime.now()).strftime("%Y%m%d_%H%M%S")
         
         # Create safe filename from location name
-        safe_location = "".join(c for c in location_name if c.isalnum() or c in (' ', '-', '_')).strip()
-        safe_location = safe_location.replace(' ', '_')
+        safe_location = location_name.translate(_SAFE_CHARS).strip().replace(' ', '_')
         
         filename = f"combined_{safe_location}_{timestamp}.json"
         output_path = self.input_transcripts_dir / filename
         
         try:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(combined_data, f, indent=2, ensure_ascii=False)
+            payload = _dumps(combined_data)
+            fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                view = memoryview(payload)
+                while view:
+                    view = view[os.write(fd, view):]
+            finally:
+                os.close(fd)
             
             print(f"✅ Combined transcript saved: {output_path}")
             return output_path
@@ -241,61 +420,89 @@ class TranscriptAutoCombiner:
             print(f"❌ Error saving combined transcript: {e}")
             raise
     
-    def mark_location_as_processed(self, location_name):
+    def mark_location_as_processed(self, location_name, run_time=None):
         """
         Mark a location as processed to avoid reprocessing.
         
+        The location is appended to the journal; the JSON snapshot is rewritten
+        once per run by save_processed_log.
+        
         Args:
             location_name (str): Location that was processed
+            run_time (datetime): Timestamp of the current run (defaults to now)
         """
-        # Load existing log
-        log_data = {'processed_combinations': [], 'last_run': None}
-        if self.processed_log.exists():
-            try:
-                with open(self.processed_log, 'r') as f:
-                    log_data = json.load(f)
-            except Exception:
-                pass
-        
-        # Add new location
-        existing_locations = set(log_data.get('processed_combinations', []))
-        existing_locations.add(location_name)
+        entry = {'location': location_name, 'processed_at': (run_time or datetime.now()).isoformat()}
+        try:
+            if self._journal is None:
+                self._journal = open(self.processed_journal, 'ab', buffering=0)
+            self._journal.write(json.dumps(entry, ensure_ascii=False).encode('utf-8') + b'\n')
+            os.fsync(self._journal.fileno())
+        except Exception as e:
+            print(f"Warning: Could not save processed combinations log: {e}")
+    
+    def save_processed_log(self, run_time=None):
+        """
+        Fold the journal into the JSON snapshot and start a fresh journal.
         
-        # Save updated log
-        log_data['processed_combinations'] = list(existing_locations)
-        log_data['last_run'] = datetime.now().isoformat()
+        Args:
+            run_time (datetime): Timestamp of the current run (defaults to now)
+        """
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
         
         try:
-            with open(self.processed_log, 'w') as f:
-                json.dump(log_data, f, indent=2)
+            log_data = {
+                'processed_combinations': sorted(self._read_processed_combinations()),
+                'last_run': (run_time or datetime.now()).isoformat()
+            }
+            tmp_path = self.processed_log.with_name(self.processed_log.name + '.tmp')
+            with open(tmp_path, 'wb') as f:
+                f.write(_dumps(log_data))
+            os.replace(tmp_path, self.processed_log)
+            
+            # Only drop the journal once its entries are safely in the snapshot
+            self.processed_journal.unlink(missing_ok=True)
         except Exception as e:
             print(f"Warning: Could not save processed combinations log: {e}")
     
-    def trigger_existing_pipeline_for_location(self, combined_transcript_path, location_name):
+    def _get_pipeline(self):
+        """
+        Import and construct your existing pipeline once, then reuse it.
+        
+        Returns:
+            CompletePipeline: Shared pipeline instance
+        """
+        if self._pipeline is None:
+            # Import your existing pipeline
+            from complete_oauth_pipeline import CompletePipeline
+            
+            # Initialize your pipeline (adjust parameters as needed)
+            self._pipeline = CompletePipeline()
+        return self._pipeline
+    
+    def trigger_existing_pipeline_for_location(self, combined_transcript_path, location_name, run_time=None):
         """
         Trigger your existing complete_oauth_pipeline.py with the combined transcript for a specific location.
         
         Args:
             combined_transcript_path (Path): Path to the combined transcript
             location_name (str): Name of the location for context
+            run_time (datetime): Timestamp of the current run (defaults to now)
             
         Returns:
             bool: True if pipeline was triggered successfully
         """
         try:
-            # Import your existing pipeline
-            from complete_oauth_pipeline import CompletePipeline
-            
             print(f"🚀 Triggering your existing AI content pipeline for {location_name}...")
             
-            # Initialize your pipeline (adjust parameters as needed)
-            pipeline = CompletePipeline()
+            pipeline = self._get_pipeline()
             
             # Process the combined transcript with location context
             result = pipeline.process_transcript_to_blog(
                 str(combined_transcript_path),
                 location=location_name,  # Use the actual location name
-                date=datetime.now().strftime("%B %Y")
+                date=(run_time or datetime.now()).strftime("%B %Y")
             )
             
             print("✅ Pipeline completed successfully!")
@@ -312,6 +519,24 @@ class TranscriptAutoCombiner:
             print(f"❌ Error running pipeline: {e}")
             return False
     
+    def _prepare_location(self, location_name, transcript_files, run_time, file_executor):
+        """
+        Combine and save the transcripts for one location (safe to run on a worker thread).
+        
+        Args:
+            location_name (str): Name of the location
+            transcript_files (List[Path]): Transcript files for this location
+            run_time (datetime): Timestamp of the current run
+            file_executor (ThreadPoolExecutor): Pool shared by all locations for reading files
+            
+        Returns:
+            Path: Path to saved combined transcript
+        """
+        print(f"🔄 Combining transcripts for {location_name}...")
+        combined_data = self.combine_transcripts_for_location(location_name, transcript_files, run_time,
+                                                              file_executor)
+        return self.save_combined_transcript_for_location(location_name, combined_data, run_time)
+    
     def run(self, trigger_pipeline=True):
         """
         Run the complete auto-combination process for all locations with new transcripts.
@@ -324,6 +549,9 @@ class TranscriptAutoCombiner:
         """
         print("🎬 Starting auto transcript combination by location...")
         
+        # One timestamp for the whole run, shared by every location
+        run_time = datetime.now()
+        
         # Find new transcript files grouped by location
         location_groups = self.find_new_transcript_files_by_location()
         
@@ -338,47 +566,59 @@ class TranscriptAutoCombiner:
             'pipeline_results': {}
         }
         
-        # Process each location separately
-        for location_name, transcript_files in location_groups.items():
-            print(f"\n🗺️  Processing location: {location_name}")
-            print(f"📁 Found {len(transcript_files)} transcript files:")
-            for file in transcript_files:
-                print(f"  - {file.parent.name}/{file.name}")
-            
-            try:
-                # Combine transcripts for this location
-                print(f"🔄 Combining transcripts for {location_name}...")
-                combined_data = self.combine_transcripts_for_location(location_name, transcript_files)
-                
-                # Save combined transcript
-                combined_file = self.save_combined_transcript_for_location(location_name, combined_data)
+        # Combine and save locations in parallel; marking and pipeline runs stay on this thread.
+        # File reads for every location share one pool, so a run uses at most 16 worker threads
+        with ThreadPoolExecutor(max_workers=8) as file_executor, \
+                ThreadPoolExecutor(max_workers=min(8, len(location_groups))) as executor:
+            futures = {}
+            for location_name, transcript_files in location_groups.items():
+                print(f"\n🗺️  Processing location: {location_name}")
+                print(f"📁 Found {len(transcript_files)} transcript files:")
+                for file in transcript_files:
+                    print(f"  - {file.parent.name}/{file.name}")
                 
-                # Mark location as processed
-                self.mark_location_as_processed(location_name)
-                
-                # Store results for this location
-                results['locations_processed'][location_name] = {
-                    'files_processed': len(transcript_files),
-                    'combined_file': str(combined_file),
-                    'source_files': [f.parent.name + '/' + f.name for f in transcript_files]
-                }
-                
-                # Trigger your existing pipeline if requested
-                pipeline_success = False
-                if trigger_pipeline:
-                    pipeline_success = self.trigger_existing_pipeline_for_location(combined_file, location_name)
-                    results['pipeline_results'][location_name] = pipeline_success
-                
-                print(f"✅ Successfully processed {location_name}")
-                if pipeline_success:
-                    print(f"🚀 Pipeline triggered for {location_name}")
-                
-            except Exception as e:
-                print(f"❌ Error processing {location_name}: {e}")
-                results['locations_processed'][location_name] = {
-                    'error': str(e),
-                    'files_attempted': len(transcript_files)
-                }
+                futures[location_name] = executor.submit(self._prepare_location, location_name, transcript_files, run_time,
+                                                         file_executor)
+            
+            # Collect in submission order so results keep the scan order
+            for location_name, future in futures.items():
+                transcript_files = location_groups[location_name]
+                try:
+                    combined_file = future.result()
+                    
+                    # Mark location as processed
+                    self.mark_location_as_processed(location_name, run_time)
+                    
+                    # Store results for this location
+                    results['locations_processed'][location_name] = {
+                        'files_processed': len(transcript_files),
+                        'combined_file': str(combined_file),
+                        'source_files': [f.parent.name + '/' + f.name for f in transcript_files]
+                    }
+                    
+                    # Trigger your existing pipeline if requested
+                    pipeline_success = False
+                    if trigger_pipeline:
+                        pipeline_success = self.trigger_existing_pipeline_for_location(combined_file, location_name, run_time)
+                        results['pipeline_results'][location_name] = pipeline_success
+                    
+                    print(f"✅ Successfully processed {location_name}")
+                    if pipeline_success:
+                        print(f"🚀 Pipeline triggered for {location_name}")
+                    
+                except Exception as e:
+                    print(f"❌ Error processing {location_name}: {e}")
+                    results['locations_processed'][location_name] = {
+                        'error': str(e),
+                        'files_attempted': len(transcript_files)
+                    }
+        
+        self.save_processed_log(run_time)
+        
+        # Release the shared pipeline's pooled connections until the next run
+        if self._pipeline is not None:
+            self._pipeline.close()
+            self._pipeline = None
         
         return results
 
@@ -460,251 +700,4 @@ def main():
     return 0
 
 if __name__ == "__main__":
-    exit(main()), file_path.parent.name)
-                if match:
-                    return int(match.group(1))
-            except:
-                pass
-            return 999  # Put unmatched files at the end
-        
-        sorted_files = sorted(transcript_files, key=extract_video_number)
-        
-        for transcript_file in sorted_files:
-            content = self.extract_transcript_content(transcript_file)
-            if not content:
-                continue
-            
-            # Add to individual transcripts
-            combined_data['combined_transcript']['content']['individual_transcripts'].append({
-                'source_file': content['source_file'],
-                'video_folder': transcript_file.parent.name,
-                'file_path': content['file_path'],
-                'processing_type': content['processing_type'],
-                'text_content': content['full_text'],
-                'segment_count': len(content['segments'])
-            })
-            
-            # Add to metadata
-            combined_data['combined_transcript']['metadata']['source_files'].append({
-                'file': content['source_file'],
-                'video_folder': transcript_file.parent.name,
-                'type': content['processing_type']
-            })
-            
-            # Add text content with video separator
-            if content['full_text']:
-                video_name = transcript_file.parent.name
-                separator = f"\n\n--- {video_name} ({content['processing_type']}) ---\n"
-                all_text_parts.append(separator + content['full_text'])
-        
-        # Combine all text
-        combined_data['combined_transcript']['content']['full_text'] = '\n'.join(all_text_parts)
-        
-        return combined_data
-    
-    def save_combined_transcript(self, combined_data):
-        """
-        Save the combined transcript for your existing pipeline.
-        
-        Args:
-            combined_data (Dict): Combined transcript data
-            
-        Returns:
-            Path: Path to saved combined transcript
-        """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"combined_transcript_{timestamp}.json"
-        output_path = self.input_transcripts_dir / filename
-        
-        try:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(combined_data, f, indent=2, ensure_ascii=False)
-            
-            print(f"✅ Combined transcript saved: {output_path}")
-            return output_path
-            
-        except Exception as e:
-            print(f"❌ Error saving combined transcript: {e}")
-            raise
-    
-    def mark_files_as_processed(self, processed_files):
-        """
-        Mark files as processed to avoid reprocessing.
-        
-        Args:
-            processed_files (List[Path]): Files that were processed
-        """
-        # Load existing log
-        log_data = {'processed_files': [], 'last_run': None}
-        if self.processed_log.exists():
-            try:
-                with open(self.processed_log, 'r') as f:
-                    log_data = json.load(f)
-            except Exception:
-                pass
-        
-        # Add new files
-        existing_files = set(log_data.get('processed_files', []))
-        for file_path in processed_files:
-            existing_files.add(str(file_path))
-        
-        # Save updated log
-        log_data['processed_files'] = list(existing_files)
-        log_data['last_run'] = datetime.now().isoformat()
-        
-        try:
-            with open(self.processed_log, 'w') as f:
-                json.dump(log_data, f, indent=2)
-        except Exception as e:
-            print(f"Warning: Could not save processed files log: {e}")
-    
-    def trigger_existing_pipeline(self, combined_transcript_path):
-        """
-        Trigger your existing complete_oauth_pipeline.py with the combined transcript.
-        
-        Args:
-            combined_transcript_path (Path): Path to the combined transcript
-            
-        Returns:
-            bool: True if pipeline was triggered successfully
-        """
-        try:
-            # Import your existing pipeline
-            from complete_oauth_pipeline import CompletePipeline
-            
-            print("🚀 Triggering your existing AI content pipeline...")
-            
-            # Initialize your pipeline (adjust parameters as needed)
-            pipeline = CompletePipeline()
-            
-            # Process the combined transcript
-            # Adjust location and date as needed, or extract from transcript metadata
-            result = pipeline.process_transcript_to_blog(
-                str(combined_transcript_path),
-                location="Adventure Location",  # You can customize this
-                date=datetime.now().strftime("%B %Y")
-            )
-            
-            print("✅ Pipeline completed successfully!")
-            print(f"📄 Google Doc: {result['doc_info']['doc_url']}")
-            print(f"📊 Tracking Sheet: {result['sheet_info']['sheet_url']}")
-            
-            return True
-            
-        except ImportError as e:
-            print(f"❌ Could not import your pipeline: {e}")
-            print("Make sure complete_oauth_pipeline.py is in the same directory")
-            return False
-        except Exception as e:
-            print(f"❌ Error running pipeline: {e}")
-            return False
-    
-    def run(self, trigger_pipeline=True):
-        """
-        Run the complete auto-combination process.
-        
-        Args:
-            trigger_pipeline (bool): Whether to trigger your existing pipeline
-            
-        Returns:
-            Dict: Processing results
-        """
-        print("🎬 Starting auto transcript combination...")
-        
-        # Find new transcript files
-        new_files = self.find_new_transcript_files()
-        
-        if not new_files:
-            print("ℹ️  No new transcript files found")
-            return {'status': 'no_new_files', 'message': 'No new transcript files to process'}
-        
-        print(f"📁 Found {len(new_files)} new transcript files:")
-        for file in new_files:
-            print(f"  - {file.name}")
-        
-        # Combine transcripts
-        print("🔄 Combining transcripts...")
-        combined_data = self.combine_transcripts(new_files)
-        
-        # Save combined transcript
-        combined_file = self.save_combined_transcript(combined_data)
-        
-        # Mark files as processed
-        self.mark_files_as_processed(new_files)
-        
-        # Trigger your existing pipeline if requested
-        pipeline_success = False
-        if trigger_pipeline:
-            pipeline_success = self.trigger_existing_pipeline(combined_file)
-        
-        return {
-            'status': 'success',
-            'files_processed': len(new_files),
-            'combined_file': str(combined_file),
-            'pipeline_triggered': pipeline_success,
-            'source_files': [f.name for f in new_files]
-        }
-
-def main():
-    """Main function for command-line usage."""
-    import argparse
-    
-    parser = argparse.ArgumentParser(
-        description='Auto-combine transcript files and trigger existing AI content pipeline'
-    )
-    parser.add_argument(
-        '--video-processor-path',
-        default='../video-processor',
-        help='Path to video processor directory'
-    )
-    parser.add_argument(
-        '--no-pipeline',
-        action='store_true',
-        help='Only combine transcripts, don\'t trigger the pipeline'
-    )
-    parser.add_argument(
-        '--check-only',
-        action='store_true',
-        help='Only check for new files, don\'t process them'
-    )
-    
-    args = parser.parse_args()
-    
-    try:
-        combiner = TranscriptAutoCombiner(
-            video_processor_path=args.video_processor_path
-        )
-        
-        if args.check_only:
-            new_files = combiner.find_new_transcript_files()
-            if new_files:
-                print(f"📁 Found {len(new_files)} new transcript files:")
-                for file in new_files:
-                    print(f"  - {file.name}")
-            else:
-                print("ℹ️  No new transcript files found")
-            return 0
-        
-        # Run the combination process
-        result = combiner.run(trigger_pipeline=not args.no_pipeline)
-        
-        if result['status'] == 'success':
-            print(f"\n🎉 Successfully processed {result['files_processed']} transcript files!")
-            print(f"📄 Combined file: {result['combined_file']}")
-            if result['pipeline_triggered']:
-                print("🚀 Your AI content pipeline was triggered!")
-                print("📱 Check your Slack for the notification!")
-        elif result['status'] == 'no_new_files':
-            print("ℹ️  No new files to process")
-        else:
-            print(f"❌ Processing failed: {result.get('message', 'Unknown error')}")
-            return 1
-        
-    except Exception as e:
-        print(f"❌ Error: {e}")
-        return 1
-    
-    return 0
-
-if __name__ == "__main__":
-    exit(main())
\ No newline at end of file
+    exit(main())